@@ -1,79 +1,279 @@
 # libro_diario/ui.py
 import argparse
+import math
+import os
+import re
+import sys
+from collections import OrderedDict, namedtuple
 from datetime import date
-from .storage import JsonStorage
-from .services import Entry, add_entry, list_entries
+from ..core.repositorio import JsonStorage
+from ..core.libro_diario import Entry, add_entry, list_entries, load_table
+from ..core import parallel_csv
+from ..core.utils import split_row, bank_fields
 
-def _read_bank_csv_row(path: str, idx_one_based: int):
+# Opcional: lector CSV en C++ para 'bank-month' sobre extractos grandes.
+# Se importa bajo demanda (ver _load_pyarrow) para no pagarlo en el resto de comandos.
+pa = pc = pacsv = None
+
+try:
+    # Opcional: extensión compilada (Cython) con el bucle completo de 'bank-month'
+    from ..core._bank_fast import month_filter as _month_filter_fast
+except ImportError:
+    _month_filter_fast = None
+
+# Fila útil del CSV bancario: Fecha, Fecha valor, Concepto, Importe, Saldo Posterior
+BankRow = namedtuple("BankRow", ["fecha", "fecha_valor", "concepto", "importe", "saldo"])
+# Columna de fecha elegible en 'bank-add' -> campo de BankRow
+_FECHA_COLS = {"Fecha": "fecha", "Fecha valor": "fecha_valor"}
+
+# Fecha bancaria DD/MM/YYYY (admite día y mes con una sola cifra)
+_DMY_RE = re.compile(r"^\s*(?P<d>\d{1,2})/(?P<m>\d{1,2})/(?P<y>\d{4})\s*$")
+# Importe en formato europeo: quita el separador de miles y usa punto decimal
+_EURO_TRANS = str.maketrans({".": "", ",": "."})
+# Importe ya normalizado que el cast de Arrow convierte igual que float()
+_DECIMAL_RE = r"^[+-]?(\d+\.?\d*|\.\d+)$"
+# Por debajo de este tamaño el coste de importar PyArrow/Numba supera al del bucle en Python
+_ARROW_MIN_SIZE = 1 << 20
+# Tamaño del buffer de lectura para los CSV bancarios
+_CSV_BUFFER = 1 << 20
+# Formato de fecha del CSV bancario
+_FMT_DMY = "%d/%m/%Y"
+
+def _load_pyarrow() -> bool:
     """
-    Lee el CSV bancario (delimitador ';') y devuelve un dict con los campos de la fila indicada (1-based).
+    Importa PyArrow la primera vez que se necesita. Devuelve False si no está instalado.
+    """
+    global pa, pc, pacsv
+    if pacsv is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return False
+    return True
+
+def _bank_rows(path: str):
+    """
+    Generador común de las filas útiles del CSV bancario (delimitador ';').
     El CSV de ejemplo incluye una primera columna vacía y una cabecera con el texto 'Cantidades expresadas en euros'.
     Normalizamos para quedarnos con las 5 columnas útiles: Fecha, Fecha valor, Concepto, Importe, Saldo Posterior.
     """
-    import csv
-    rows = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter=';')
-        try:
-            header = next(reader, None)
-        except StopIteration:
-            raise ValueError("CSV vacío")
-        if header is None:
-            raise ValueError("CSV vacío")
-        # Normaliza las cabeceras para quedarnos con las 5 últimas columnas
-        headers = header[-5:]
-        # Recolecta filas no vacías (ignoramos la primera columna vacía cuando exista)
-        for r in reader:
-            if not r:
-                continue
-            # Tomamos las 5 últimas columnas para casar con headers
-            data = r[-5:]
-            if len(data) != 5:
-                # Filas corruptas o en blanco
+    # Buffer de 1 MB: menos llamadas a read() en extractos grandes.
+    # newline="" conserva los finales de línea tal cual (los quita split_row)
+    with open(path, "r", encoding="utf-8", buffering=_CSV_BUFFER, newline="") as f:
+        header = split_row(f.readline())
+        if not header:
+            return
+        for line in f:
+            # 5 últimas columnas (posiciones fijas de BankRow); None en filas corruptas o en blanco
+            data = bank_fields(line)
+            if data is None:
                 continue
-            rows.append(dict(zip(headers, data)))
-    # Soportar índice 1-based (más natural para el usuario)
-    real_index = idx_one_based - 1
-    if real_index < 0 or real_index >= len(rows):
-        raise IndexError(f"Índice fuera de rango: {idx_one_based}. Total filas: {len(rows)}")
-    return rows[real_index]
+            yield BankRow(data[0], data[1], data[2], data[3], data[4])
+
+def _csv_fingerprint(path: str):
+    """
+    Clave de caché de un CSV: cambia en cuanto el fichero se modifica.
+    """
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+# Filas ya parseadas por huella de fichero (LRU pequeño, ver _load_bank_rows_cached)
+_BANK_ROWS_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_BANK_ROWS_CACHE_SIZE = 16
+
+def _load_bank_rows_cached(fp):
+    """
+    Parsea una vez el CSV identificado por fp (ver _csv_fingerprint) y devuelve
+    una tupla inmutable de BankRow, reutilizable entre subcomandos del mismo proceso.
+    Los ficheros grandes se parsean en paralelo (ver core/parallel_csv.py).
+    """
+    rows = _BANK_ROWS_CACHE.get(fp)
+    if rows is not None:
+        _BANK_ROWS_CACHE.move_to_end(fp)
+        return rows
+    path = fp[0]
+    if fp[2] >= parallel_csv.MIN_PARALLEL_SIZE:
+        rows = tuple(map(BankRow._make, parallel_csv.read_rows(path)))
+    else:
+        rows = tuple(_bank_rows(path))
+    _BANK_ROWS_CACHE[fp] = rows
+    if len(_BANK_ROWS_CACHE) > _BANK_ROWS_CACHE_SIZE:
+        _BANK_ROWS_CACHE.popitem(last=False)
+    return rows
+
+def _read_bank_csv_row(path: str, idx_one_based: int):
+    """
+    Devuelve un BankRow con los campos de la fila indicada (1-based) del CSV bancario.
+    Si el fichero ya está en caché se indexa directamente; si no, se lee sólo
+    hasta la fila pedida (sin parsear ni cachear el extracto entero).
+    """
+    if idx_one_based < 1:
+        raise IndexError(f"Índice fuera de rango: {idx_one_based}")
+    rows = _BANK_ROWS_CACHE.get(_csv_fingerprint(path))
+    if rows is not None:
+        if idx_one_based > len(rows):
+            raise IndexError(f"Índice fuera de rango: {idx_one_based}. Total filas: {len(rows)}")
+        return rows[idx_one_based - 1]
+    count = 0
+    for row in _bank_rows(path):
+        count += 1
+        if count == idx_one_based:
+            return row
+    raise IndexError(f"Índice fuera de rango: {idx_one_based}. Total filas: {count}")
 
 def _iter_bank_csv_rows(path: str):
     """
-    Itera todas las filas útiles del CSV bancario y devuelve una lista de dicts
+    Itera todas las filas útiles del CSV bancario (un BankRow por fila)
     con las 5 columnas: Fecha, Fecha valor, Concepto, Importe, Saldo Posterior.
     """
-    import csv
-    rows = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter=';')
-        header = next(reader, None)
-        if not header:
-            return rows
-        headers = header[-5:]
-        for r in reader:
-            if not r:
-                continue
-            data = r[-5:]
-            if len(data) != 5:
-                continue
-            rows.append(dict(zip(headers, data)))
-    return rows
+    return iter(_load_bank_rows_cached(_csv_fingerprint(path)))
+
+def _bank_month_rows(path: str, year: int, month: int):
+    """
+    Genera las filas del CSV cuya columna 'Fecha' (DD/MM/YYYY) cae en el mes indicado.
+    Una sola pasada sobre el fichero: sólo se retienen las filas del mes.
+    """
+    # Filtro barato: la fecha debe terminar en '/MM/YYYY' (o '/M/YYYY').
+    # Sólo las filas que lo pasan se parsean, para validar el día.
+    tails = (f"/{month:02d}/{year:04d}", f"/{month}/{year:04d}")
+    for row in _iter_bank_csv_rows(path):
+        fecha_txt = row.fecha.strip()
+        if not fecha_txt.endswith(tails):
+            continue
+        try:
+            _parse_ddmmyyyy(fecha_txt)
+        except Exception:
+            continue
+        yield row
+
+def _read_bank_arrow(path: str):
+    """
+    Lee el CSV bancario con PyArrow aplicando las mismas reglas que _bank_rows:
+    se ignora la primera línea (sólo tiene que no estar en blanco), cada línea se
+    parte por ';' y se toman sus 5 últimas columnas, descartando las que tengan menos.
+    Todo se lee como texto, sin inferencia de tipos. Devuelve una tabla con los
+    campos de BankRow, o None si el fichero trae comillas (ver split_row).
+    """
+    import numpy as np
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not split_row(header.decode("utf-8")) or f.tell() >= os.fstat(f.fileno()).st_size:
+            return pa.table({name: pa.array([], pa.string()) for name in BankRow._fields})
+        # Una columna por línea (el separador de unidad no aparece en el extracto),
+        # leyendo a partir de la cabecera ya consumida
+        lines = pacsv.read_csv(
+            f,
+            read_options=pacsv.ReadOptions(column_names=["linea"]),
+            parse_options=pacsv.ParseOptions(delimiter="\x1f", quote_char=False, escape_char=False),
+            convert_options=pacsv.ConvertOptions(column_types={"linea": pa.string()}),
+        ).column(0)
+    if pc.any(pc.match_substring(lines, '"')).as_py():
+        return None
+    parts = pc.split_pattern(lines, ";")
+    lengths = pc.list_value_length(parts).to_numpy(zero_copy_only=False)
+    keep = lengths >= 5
+    ends = np.cumsum(lengths)[keep]
+    values = pc.list_flatten(parts)
+    columns = [values.take(pa.array(ends - 5 + k)) for k in range(5)]
+    return pa.Table.from_arrays(columns, names=list(BankRow._fields))
+
+def _arrow_euro_amounts(col):
+    """
+    Versión vectorizada de _parse_euro_amount sobre una columna Arrow de texto.
+    Los valores que no son un número decimal simple (la fila de cabecera, importes
+    vacíos...) se excluyen del cast y sólo ésos se parsean fila a fila.
+    """
+    import numpy as np
+    txt = pc.utf8_trim_whitespace(col)
+    txt = pc.replace_substring(pc.replace_substring(txt, ".", ""), ",", ".")
+    ok = pc.fill_null(pc.match_substring_regex(txt, _DECIMAL_RE), False)
+    amounts = pc.cast(pc.if_else(ok, txt, None), pa.float64())
+    amounts = pc.fill_null(amounts, 0.0).to_numpy(zero_copy_only=False)
+    bad = np.flatnonzero(~ok.to_numpy(zero_copy_only=False))
+    if len(bad):
+        amounts = amounts.copy()
+        for i, s in zip(bad, col.take(pa.array(bad)).to_pylist()):
+            amounts[i] = _parse_euro_amount(s) if s is not None else 0.0
+    return amounts
+
+def _bank_month_arrow(path: str, year: int, month: int):
+    """
+    Filtra por mes con Arrow compute (columna 'Fecha', DD/MM/YYYY).
+    Devuelve (filas del mes como BankRow, importes de esas filas, (nº movimientos, total));
+    el recuento y el total los calcula el kernel de fast_agg sobre los arrays de año/mes/importe.
+    Devuelve None si el CSV necesita el lector en Python (campos entre comillas).
+    """
+    from ..core.fast_agg import month_totals
+    if os.path.getsize(path) == 0:
+        return [], [], (0, 0.0)
+    table = _read_bank_arrow(path)
+    if table is None:
+        return None
+    fechas = pc.utf8_trim_whitespace(table.column(0))
+    dates = pc.strptime(fechas, format=_FMT_DMY, unit="ms", error_is_null=True)
+    # strptime no rechaza días imposibles (30/02 pasa a 02/03): como en _parse_ddmmyyyy,
+    # la fecha sólo vale si día y mes parseados coinciden con el texto
+    dmy = pc.extract_regex(fechas, _DMY_RE.pattern)
+    valid = pc.and_(
+        pc.equal(pc.day(dates), pc.cast(pc.struct_field(dmy, [0]), pa.int64())),
+        pc.equal(pc.month(dates), pc.cast(pc.struct_field(dmy, [1]), pa.int64())),
+    )
+    valid = pc.fill_null(valid, False)
+    valid_np = valid.to_numpy(zero_copy_only=False)
+    amounts = _arrow_euro_amounts(table.column(3))
+    # El kernel sólo recibe filas con fecha válida (sin valores centinela para las demás)
+    totals = month_totals(
+        pc.year(dates).filter(valid).to_numpy(zero_copy_only=False),
+        pc.month(dates).filter(valid).to_numpy(zero_copy_only=False),
+        amounts[valid_np],
+        year,
+        month,
+    )
+    mask = pc.and_(valid, pc.and_(pc.equal(pc.year(dates), year), pc.equal(pc.month(dates), month)))
+    mask = pc.fill_null(mask, False)
+    filtered = table.filter(mask)
+    rows = [BankRow._make(t) for t in zip(*(col.to_pylist() for col in filtered.columns))]
+    return rows, amounts[mask.to_numpy(zero_copy_only=False)], totals
+
 def _parse_ddmmyyyy(s: str):
-    from datetime import datetime
     # Acepta '04/09/2025' y también '4/9/2025'
-    return datetime.strptime(s.strip(), "%d/%m/%Y").date()
+    m = _DMY_RE.match(s)
+    if not m:
+        raise ValueError(f"Fecha inválida: {s!r}")
+    d, mo, y = m.groups()
+    return date(int(y), int(mo), int(d))
 def _parse_euro_amount(s: str) -> float:
     """
     Convierte una cantidad con coma decimal a float (p.ej. '-2,37' -> -2.37).
     Elimina separadores de miles con punto si aparecen.
     """
-    s = s.strip().replace('.', '').replace(',', '.')
+    s = s.strip().translate(_EURO_TRANS)
     try:
         return float(s)
     except ValueError:
         return 0.0
 
+def _finite_float(s: str) -> float:
+    """
+    float() que rechaza NaN e infinitos (no se pueden guardar como asiento).
+    """
+    try:
+        value = float(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inválido: {s!r}")
+    if not math.isfinite(value):
+        raise argparse.ArgumentTypeError(f"el importe debe ser finito: {s!r}")
+    return value
+
+def _write_lines(lines) -> None:
+    """
+    Escribe todas las líneas de una vez en stdout (una sola escritura en lugar de un print por fila).
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 def _prompt_with_default(label: str, default: str) -> str:
     """
     Pide al usuario un valor en stdin mostrando un valor por defecto.
@@ -86,15 +286,15 @@ def _prompt_with_default(label: str, default: str) -> str:
         return default
     return default if inp == "" else inp
 
-def main(argv=None) -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="libro-diario", description="Libro Diario minimal")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
     p_add = sub.add_parser("add", help="Añadir asiento")
-    p_add.add_argument("--fecha", default=date.today().isoformat(), help="YYYY-MM-DD (por defecto: hoy)")
+    p_add.add_argument("--fecha", default=None, help="YYYY-MM-DD (por defecto: hoy)")
     p_add.add_argument("--concepto", required=True)
-    p_add.add_argument("--debe", type=float, default=0.0)
-    p_add.add_argument("--haber", type=float, default=0.0)
+    p_add.add_argument("--debe", type=_finite_float, default=0.0)
+    p_add.add_argument("--haber", type=_finite_float, default=0.0)
 
     p_list = sub.add_parser("list", help="Listar asientos")
     p_list.add_argument("--raw", action="store_true", help="Imprimir objetos raw")
@@ -115,12 +315,32 @@ def main(argv=None) -> None:
     p_bank_add.add_argument("--fecha-col", choices=["Fecha", "Fecha valor"], default="Fecha", help="Columna de fecha a usar (por defecto: Fecha)")
     p_bank_add.add_argument("--no-interactive", action="store_true", help="Crear el asiento usando valores sugeridos sin preguntar")
 
-    args = parser.parse_args(argv)
-    storage = JsonStorage("data/libro_diario.json")
+    return parser
+
+# Se construye una sola vez al importar: llamadas repetidas a main() reutilizan el parser
+_PARSER = _build_parser()
+
+_STORAGE_PATH = "data/libro_diario.json"
+_storage = None
+
+def _default_storage() -> JsonStorage:
+    """
+    Devuelve el JsonStorage del libro diario, reutilizando la instancia (y su caché)
+    mientras apunte al mismo fichero y éste exista.
+    """
+    global _storage
+    path = os.path.abspath(_STORAGE_PATH)
+    if _storage is None or str(_storage.path) != path or not _storage.path.exists():
+        _storage = JsonStorage(path)
+    return _storage
+
+def main(argv=None) -> None:
+    args = _PARSER.parse_args(argv)
+    storage = _default_storage()
 
     if args.cmd == "add":
         e = Entry(
-            fecha=date.fromisoformat(args.fecha),
+            fecha=date.fromisoformat(args.fecha) if args.fecha else date.today(),
             concepto=args.concepto,
             debe=args.debe,
             haber=args.haber,
@@ -128,17 +348,23 @@ def main(argv=None) -> None:
         add_entry(storage, e)
         print("Asiento guardado.")
     elif args.cmd == "list":
-        entries = list_entries(storage)
-        if args.raw:
-            for e in entries:
-                print(e)
+        try:
+            if args.raw:
+                _write_lines([str(e) for e in list_entries(storage)])
+                return
+            table = load_table(storage)
+        except ValueError as exc:
+            print(f"Error leyendo el libro diario: {exc}")
             return
-        total_debe = sum(e.debe for e in entries)
-        total_haber = sum(e.haber for e in entries)
-        for e in entries:
-            print(f"{e.fecha.isoformat()} | {e.concepto:<30} | D:{e.debe:8.2f} | H:{e.haber:8.2f}")
-        print("-" * 74)
-        print(f"{'TOTAL':<35} D:{total_debe:8.2f} | H:{total_haber:8.2f} | Δ:{(total_debe-total_haber):8.2f}")
+        total_debe = table.total_debe()
+        total_haber = table.total_haber()
+        lines = [
+            f"{fecha.isoformat()} | {concepto:<30} | D:{debe:8.2f} | H:{haber:8.2f}"
+            for fecha, concepto, debe, haber in zip(table.fechas, table.conceptos, table.debes, table.haberes)
+        ]
+        lines.append("-" * 74)
+        lines.append(f"{'TOTAL':<35} D:{total_debe:8.2f} | H:{total_haber:8.2f} | Δ:{(total_debe-total_haber):8.2f}")
+        _write_lines(lines)
     elif args.cmd == "bank":
         try:
             row = _read_bank_csv_row(args.csv, args.id)
@@ -146,62 +372,70 @@ def main(argv=None) -> None:
             print(f"Error leyendo CSV: {exc}")
             return
         if args.raw:
-            print(row)
+            print(row._asdict())
             return
         # Formateo amigable
-        fecha = row.get("Fecha", "")
-        fecha_valor = row.get("Fecha valor", "")
-        concepto = row.get("Concepto", "")
-        importe = row.get("Importe", "")
-        saldo = row.get("Saldo Posterior", "")
+        fecha, fecha_valor, concepto, importe, saldo = row
         print(f"Fecha:        {fecha}")
         print(f"Fecha valor:  {fecha_valor}")
         print(f"Concepto:     {concepto}")
         print(f"Importe:      {importe}")
         print(f"Saldo Posterior: {saldo}")
     elif args.cmd == "bank-month":
+        # Filtra por mes YYYY-MM comparando con la columna 'Fecha' (DD/MM/YYYY)
+        wanted = args.month
+        try:
+            want_year, want_month = (int(p) for p in wanted.split("-"))
+        except ValueError:
+            print(f"Mes inválido: {wanted}. Usa el formato YYYY-MM")
+            return
+        if not 1 <= want_month <= 12:
+            print(f"Mes inválido: {wanted}. El mes debe estar entre 01 y 12")
+            return
+        # (nº movimientos, total) cuando el backend ya los calcula; si no, se acumulan aquí
+        totals = None
+        amounts = None
+        # Una sola pasada: filtra, parsea el importe, acumula y formatea cada fila a la vez
+        out_lines = [] if args.raw else [f"Movimientos {wanted}", "-" * 74]
+        n_movs = 0
+        total = 0.0
         try:
-            rows = _iter_bank_csv_rows(args.csv)
+            if _month_filter_fast is not None:
+                rows, amounts, totals = _month_filter_fast(args.csv, want_year, want_month)
+                rows = map(BankRow._make, rows)
+            elif (
+                os.path.getsize(args.csv) >= _ARROW_MIN_SIZE
+                and _load_pyarrow()
+                and (arrow := _bank_month_arrow(args.csv, want_year, want_month)) is not None
+            ):
+                rows, amounts, totals = arrow
+            else:
+                rows = _bank_month_rows(args.csv, want_year, want_month)
+            for i, r in enumerate(rows):
+                if totals is None:
+                    n_movs += 1
+                if args.raw:
+                    out_lines.append(str(r._asdict()))
+                    continue
+                if amounts is None:
+                    importe_val = _parse_euro_amount(r.importe)
+                    total += importe_val
+                else:
+                    importe_val = amounts[i]
+                out_lines.append(f"{r.fecha} | {r.concepto:<40} | Importe:{importe_val:10.2f} | Saldo:{r.saldo}")
         except Exception as exc:
             print(f"Error leyendo CSV: {exc}")
             return
-        # Filtra por mes YYYY-MM comparando con la columna 'Fecha' (DD/MM/YYYY)
-        wanted = args.month
-        filtered = []
-        for row in rows:
-            fecha_txt = row.get("Fecha", "").strip()
-            if not fecha_txt:
-                continue
-            try:
-                d = _parse_ddmmyyyy(fecha_txt)
-            except Exception:
-                continue
-            ym = f"{d.year:04d}-{d.month:02d}"
-            if ym == wanted:
-                filtered.append(row)
-        if not filtered:
+        if totals is not None:
+            n_movs, total = totals
+        if not n_movs:
             print(f"Sin movimientos para {wanted}.")
             return
-        if args.raw:
-            for r in filtered:
-                print(r)
-            return
-        # Salida amigable + totales
-        total = 0.0
-        print(f"Movimientos {wanted}")
-        print("-" * 74)
-        for r in filtered:
-            fecha = r.get("Fecha", "")
-            concepto = r.get("Concepto", "")
-            importe_txt = r.get("Importe", "")
-            saldo = r.get("Saldo Posterior", "")
-            importe_val = _parse_euro_amount(importe_txt)
-            total += importe_val
-            print(f"{fecha} | {concepto:<40} | Importe:{importe_val:10.2f} | Saldo:{saldo}")
-        print("-" * 74)
-        n_movs = len(filtered)
-        print(f"{'Nº MOVIMIENTOS':<55} {n_movs:10d}")
-        print(f"{'TOTAL MES':<55} {total:10.2f}")
+        if not args.raw:
+            out_lines.append("-" * 74)
+            out_lines.append(f"{'Nº MOVIMIENTOS':<55} {n_movs:10d}")
+            out_lines.append(f"{'TOTAL MES':<55} {total:10.2f}")
+        _write_lines(out_lines)
     elif args.cmd == "bank-add":
         # 1) Leer el movimiento del CSV
         try:
@@ -211,21 +445,21 @@ def main(argv=None) -> None:
             return
         # 2) Mostrar info del movimiento
         print("Movimiento seleccionado:")
-        print(f"  Fecha:        {row.get('Fecha', '')}")
-        print(f"  Fecha valor:  {row.get('Fecha valor', '')}")
-        print(f"  Concepto:     {row.get('Concepto', '')}")
-        print(f"  Importe:      {row.get('Importe', '')}")
-        print(f"  Saldo:        {row.get('Saldo Posterior', '')}")
+        print(f"  Fecha:        {row.fecha}")
+        print(f"  Fecha valor:  {row.fecha_valor}")
+        print(f"  Concepto:     {row.concepto}")
+        print(f"  Importe:      {row.importe}")
+        print(f"  Saldo:        {row.saldo}")
         # 3) Sugerir valores para el asiento
-        concepto_sug = row.get("Concepto", "").strip()
+        concepto_sug = row.concepto.strip()
         # Fecha preferida según bandera
-        fecha_txt = row.get(args.fecha_col, "").strip()
+        fecha_txt = getattr(row, _FECHA_COLS[args.fecha_col]).strip()
         try:
             fecha_sug = _parse_ddmmyyyy(fecha_txt).isoformat()
         except Exception:
             # Fallback: hoy
             fecha_sug = date.today().isoformat()
-        importe_val = _parse_euro_amount(row.get("Importe", "0"))
+        importe_val = _parse_euro_amount(row.importe)
         if importe_val < 0:
             debe_sug = 0.0
             haber_sug = abs(importe_val)
@@ -251,12 +485,12 @@ def main(argv=None) -> None:
                 print(f"Advertencia: fecha inválida '{fecha_final_str}', usando sugerida {fecha_sug}")
                 fecha_final = fecha_sug
             try:
-                debe_final = float(debe_final_str)
+                debe_final = _finite_float(debe_final_str)
             except Exception:
                 print(f"Advertencia: debe inválido '{debe_final_str}', usando sugerido {debe_sug:.2f}")
                 debe_final = debe_sug
             try:
-                haber_final = float(haber_final_str)
+                haber_final = _finite_float(haber_final_str)
             except Exception:
                 print(f"Advertencia: haber inválido '{haber_final_str}', usando sugerido {haber_sug:.2f}")
                 haber_final = haber_sug
@@ -0,0 +1,28 @@
+# contabilidad/core/fast_agg.py
+"""
+Agregaciones numéricas para extractos bancarios grandes.
+Si Numba está instalado el bucle se compila a código máquina (cache=True guarda
+la compilación en disco entre ejecuciones); si no, se ejecuta como Python normal.
+"""
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # Sustituto sin Numba: devuelve la función tal cual
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+@njit(cache=True)
+def month_totals(year_arr, month_arr, amount_arr, want_year, want_month):
+    """
+    Recorre los arrays paralelos (año, mes, importe) y devuelve (nº movimientos, total)
+    de las filas que caen en want_year/want_month.
+    """
+    count = 0
+    total = 0.0
+    for i in range(len(year_arr)):
+        if year_arr[i] == want_year and month_arr[i] == want_month:
+            count += 1
+            total += amount_arr[i]
+    return count, total
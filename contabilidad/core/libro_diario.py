@@ -1,7 +1,21 @@
 # libro_diario/services.py
+import math
 from dataclasses import dataclass
 from datetime import date
-from typing import Protocol, Iterable, Dict, Any, List
+from typing import Protocol, Iterable, Dict, Any, List, Tuple
+
+def _importes(debe: Any, haber: Any) -> Tuple[float, float]:
+    """
+    Valida y convierte a float un par debe/haber (acepta int o texto numérico del JSON).
+    NaN/inf no son importes válidos: lanza ValueError, igual que un valor no numérico.
+    """
+    try:
+        debe, haber = float(debe), float(haber)
+    except (TypeError, ValueError):
+        raise ValueError(f"Importes inválidos: debe={debe!r}, haber={haber!r}")
+    if not (math.isfinite(debe) and math.isfinite(haber)):
+        raise ValueError(f"Importes no finitos: debe={debe}, haber={haber}")
+    return debe, haber
 
 @dataclass
 class Entry:
@@ -10,30 +24,78 @@ class Entry:
     debe: float
     haber: float
 
+    def __post_init__(self):
+        # Coerción en la frontera: serialize/deserialize ya pueden confiar en el tipo
+        self.debe, self.haber = _importes(self.debe, self.haber)
+
+@dataclass
+class EntryTable:
+    """
+    Asientos en columnas paralelas (estructura de arrays) para agregar sin
+    recorrer objetos Entry. debes/haberes son arrays float64 si NumPy está instalado
+    y listas de float si no.
+    """
+    fechas: List[date]
+    conceptos: List[str]
+    debes: Any
+    haberes: Any
+
+    def __len__(self) -> int:
+        return len(self.conceptos)
+
+    def total_debe(self) -> float:
+        return _total(self.debes)
+
+    def total_haber(self) -> float:
+        return _total(self.haberes)
+
+def _total(values: Any) -> float:
+    # ndarray.sum() es una reducción en C; con listas se suma en Python
+    return float(values.sum()) if hasattr(values, "sum") else float(sum(values))
+
 class Storage(Protocol):
     def load(self) -> Iterable[Dict[str, Any]]: ...
+    def append(self, row: Dict[str, Any]) -> None: ...
     def save_all(self, rows: Iterable[Dict[str, Any]]) -> None: ...
 
 def serialize(e: Entry) -> Dict[str, Any]:
     return {
         "fecha": e.fecha.isoformat(),
         "concepto": e.concepto,
-        "debe": float(e.debe),
-        "haber": float(e.haber)
+        "debe": e.debe,
+        "haber": e.haber
     }
 
 def deserialize(row: Dict[str,Any]) -> Entry:
     return Entry(
         fecha = date.fromisoformat(row["fecha"]),
         concepto = row["concepto"],
-        debe = float(row["debe"]),
-        haber = float(row["haber"])
+        debe = row["debe"],
+        haber = row["haber"]
     )
 
 def add_entry(storage: Storage, e: Entry) -> None:
-    rows = list(storage.load())
-    rows.append(serialize(e))
-    storage.save_all(rows)
+    storage.append(serialize(e))
 
 def list_entries(storage: Storage) -> List[Entry]:
-    return [deserialize(r) for r in storage.load()]
\ No newline at end of file
+    return [deserialize(r) for r in storage.load()]
+
+def load_table(storage: Storage) -> EntryTable:
+    fechas, conceptos, debes, haberes = [], [], [], []
+    for r in storage.load():
+        # Misma validación que Entry: una fila con NaN/inf falla igual en 'list' y en 'list --raw'
+        debe, haber = _importes(r["debe"], r["haber"])
+        fechas.append(date.fromisoformat(r["fecha"]))
+        conceptos.append(r["concepto"])
+        debes.append(debe)
+        haberes.append(haber)
+    try:
+        # Opcional: columnas numéricas como arrays contiguos para los totales.
+        # Se importa aquí para no pagar el import de NumPy en el resto de subcomandos
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        debes = np.array(debes, dtype=np.float64)
+        haberes = np.array(haberes, dtype=np.float64)
+    return EntryTable(fechas=fechas, conceptos=conceptos, debes=debes, haberes=haberes)
\ No newline at end of file
@@ -1,26 +1,99 @@
 # libro_diario/storage.py
 from __future__ import annotations
 import json
+import math
 from pathlib import Path
-from typing import Iterable, Dict, Any
+from typing import Iterable, Dict, Any, List, Optional, Tuple
+
+try:
+    # Opcional: serializador en C, escribe bytes UTF-8 directamente
+    import orjson
+
+    def _dumps(row: Dict[str, Any]) -> bytes:
+        # orjson escribe NaN/inf como null: esas filas (sólo pueden venir de un
+        # fichero antiguo al migrarlo) se escriben con json estándar para no perder el valor
+        if any(isinstance(v, float) and not math.isfinite(v) for v in row.values()):
+            return json.dumps(row, ensure_ascii=False).encode("utf-8")
+        return orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Ficheros escritos por json estándar pueden traer NaN/Infinity
+            return json.loads(data)
+except ImportError:
+    def _dumps(row: Dict[str, Any]) -> bytes:
+        return json.dumps(row, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
 
 class JsonStorage:
     """
-    Persistencia simple en un fichero JSON.
+    Persistencia simple en un fichero JSON Lines (un asiento serializado por línea).
     Almacena la cuentas disponibles.
     """
     def __init__(self, path: str | Path):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
-            self.path.write_text("[]", encoding="utf-8")
+            self.path.write_text("", encoding="utf-8")
+        # Caché de filas parseadas, válida mientras no cambien (mtime, tamaño) del fichero
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
+    
+    def _stat_key(self) -> Tuple[int, int]:
+        st = self.path.stat()
+        return (st.st_mtime_ns, st.st_size)
     
     def load(self) -> Iterable[Dict[str, Any]]:
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        # Se devuelve una copia: el llamante no ve (ni altera) la caché interna
+        key = self._stat_key()
+        if key == self._cache_key and self._cache is not None:
+            return list(self._cache)
+        raw = self.path.read_bytes()
+        if raw.lstrip()[:1] == b"[":
+            # Formato antiguo (array JSON): se convierte una vez a JSON Lines
+            data = _loads(raw)
+            self.save_all(data)
+            return list(data)
+        data = [_loads(line) for line in raw.splitlines() if line.strip()]
+        self._cache = data
+        self._cache_key = (key[0], len(raw))
+        return list(data)
+    
+    def _is_legacy_array(self) -> bool:
+        # Sólo mira el primer carácter no blanco del fichero
+        with self.path.open("rb") as f:
+            while True:
+                chunk = f.read(64)
+                if not chunk:
+                    return False
+                chunk = chunk.lstrip()
+                if chunk:
+                    return chunk[:1] == b"["
+    
+    def append(self, row: Dict[str, Any]) -> None:
+        # Añade una sola línea al final: O(1) por asiento, sin reescribir el fichero
+        if self._is_legacy_array():
+            self.load()
+        before = self._stat_key()
+        line = _dumps(row) + b"\n"
+        with self.path.open("ab") as f:
+            f.write(line)
+        after = self._stat_key()
+        # La caché sólo sigue siendo válida si nadie más ha escrito entre medias:
+        # el fichero debe haber crecido exactamente lo que hemos escrito nosotros
+        if self._cache is not None and before == self._cache_key and after[1] == before[1] + len(line):
+            self._cache.append(row)
+            self._cache_key = after
+        else:
+            self._cache = None
+            self._cache_key = None
     
     def save_all(self, rows: Iterable[Dict[str, Any]]) -> None:
+        # Reescritura completa: sólo para compactar el fichero
         data = list(rows)
-        self.path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
\ No newline at end of file
+        self.path.write_bytes(b"".join(_dumps(r) + b"\n" for r in data))
+        self._cache = data
+        self._cache_key = self._stat_key()
\ No newline at end of file
@@ -1 +1,26 @@
-# libro_diario.py
+# contabilidad/core/utils.py
+"""
+Utilidades comunes a los lectores del CSV bancario (CLI y parallel_csv).
+"""
+import csv
+from typing import List, Optional
+
+def split_row(line: str) -> List[str]:
+    """
+    Separa una línea del CSV bancario por ';'. El formato del banco no usa comillas,
+    así que basta con str.split; sólo si la línea contiene '"' se recurre a csv.reader.
+    """
+    if '"' in line:
+        return next(csv.reader([line], delimiter=';'), [])
+    line = line.rstrip("\r\n")
+    return line.split(";") if line else []
+
+def bank_fields(line: str) -> Optional[List[str]]:
+    """
+    Normaliza una línea del CSV bancario a sus 5 columnas útiles (las 5 últimas):
+    Fecha, Fecha valor, Concepto, Importe, Saldo Posterior.
+    El CSV del banco puede traer una primera columna vacía o columnas de más por la izquierda.
+    Devuelve None para líneas en blanco o con menos de 5 columnas.
+    """
+    data = split_row(line)[-5:]
+    return data if len(data) == 5 else None
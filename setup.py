@@ -0,0 +1,20 @@
+# setup.py
+"""
+Compila la extensión opcional contabilidad.core._bank_fast si Cython está disponible.
+Cython no es dependencia de build: hay que instalarlo antes (y construir sin aislamiento,
+p.ej. `pip install --no-build-isolation .`) para obtener la extensión.
+El resto de metadatos del paquete está en pyproject.toml.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("contabilidad/core/_bank_fast.pyx", language_level=3)
+    for ext in ext_modules:
+        # Si no hay compilador de C, se instala sin la extensión
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,202 @@
+from datetime import date
+
+import pytest
+
+from contabilidad.cli import main as cli
+
+# Extracto con línea de título, importes que Arrow inferiría como números,
+# filas con columnas de más / de menos, fechas inválidas y líneas en blanco
+CSV_BANCO = (
+    ";Cantidades expresadas en euros\r\n"
+    ";Fecha;Fecha valor;Concepto;Importe;Saldo Posterior\r\n"
+    ";01/02/2025;01/02/2025;Nómina;1.500;0012\r\n"
+    "\r\n"
+    ";5/2/2025;05/02/2025;Compra;1.203;0013\r\n"
+    "extra;;07/02/2025;07/02/2025;Luz;-55,5;1.219,16\r\n"
+    ";30/02/2025;;Fecha imposible;1,00;1\r\n"
+    ";bad;row\r\n"
+    ";03/03/2025;03/03/2025;Otro mes;-2,37;10\r\n"
+)
+
+
+@pytest.fixture
+def csv_banco(tmp_path):
+    path = tmp_path / "banco.csv"
+    path.write_text(CSV_BANCO, encoding="utf-8")
+    return str(path)
+
+
+def test_bank_month_rows(csv_banco):
+    rows = list(cli._bank_month_rows(csv_banco, 2025, 2))
+    assert [r.concepto for r in rows] == ["Nómina", "Compra", "Luz"]
+    assert [cli._parse_euro_amount(r.importe) for r in rows] == [1500.0, 1203.0, -55.5]
+
+
+def test_bank_month_arrow_coincide_con_python(csv_banco):
+    pytest.importorskip("pyarrow")
+    assert cli._load_pyarrow()
+    for year, month in [(2025, 2), (2025, 3), (2024, 2)]:
+        rows, amounts, (count, total) = cli._bank_month_arrow(csv_banco, year, month)
+        expected = list(cli._bank_month_rows(csv_banco, year, month))
+        assert rows == expected
+        expected_amounts = [cli._parse_euro_amount(r.importe) for r in expected]
+        assert list(amounts) == expected_amounts
+        assert count == len(expected)
+        assert total == pytest.approx(sum(expected_amounts))
+
+
+def test_bank_month_arrow_mes_cero_no_lista_filas_invalidas(csv_banco):
+    pytest.importorskip("pyarrow")
+    assert cli._load_pyarrow()
+    rows, amounts, (count, total) = cli._bank_month_arrow(csv_banco, 0, 0)
+    assert rows == [] and list(amounts) == [] and count == 0
+
+
+def test_arrow_euro_amounts_vectoriza_y_solo_parsea_los_invalidos(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    assert cli._load_pyarrow()
+    llamadas = []
+    parse = cli._parse_euro_amount
+    monkeypatch.setattr(cli, "_parse_euro_amount", lambda s: llamadas.append(s) or parse(s))
+    col = pa.chunked_array([["Importe", "1.500", " -55,5 ", "", "0012", "1,"]])
+    assert list(cli._arrow_euro_amounts(col)) == [0.0, 1500.0, -55.5, 0.0, 12.0, 1.0]
+    assert llamadas == ["Importe", ""]
+
+
+def test_bank_month_no_usa_arrow_en_ficheros_pequenos(csv_banco, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli, "_month_filter_fast", None)
+
+    def no_arrow(*args):
+        raise AssertionError("Arrow no debería usarse por debajo de _ARROW_MIN_SIZE")
+
+    monkeypatch.setattr(cli, "_bank_month_arrow", no_arrow)
+    cli.main(["bank-month", "--csv", csv_banco, "--month", "2025-02"])
+    out = capsys.readouterr().out
+    assert "Nómina" in out and "TOTAL MES" in out
+
+
+def test_bank_month_cython_coincide_con_python(tmp_path):
+    bank_fast = pytest.importorskip("contabilidad.core._bank_fast")
+    path = tmp_path / "banco.csv"
+    path.write_text(
+        CSV_BANCO
+        + ';04/02/2025;04/02/2025;"Pago; con punto y coma";-3,00;10\r\n'
+        + ";01/13/2025;01/13/2025;Mes 13;1,00;11\r\n",
+        encoding="utf-8",
+    )
+    for year, month in [(2025, 2), (2025, 3), (2024, 2), (2025, 13)]:
+        rows, amounts, (count, total) = bank_fast.month_filter(str(path), year, month)
+        expected = list(cli._bank_month_rows(str(path), year, month))
+        assert [cli.BankRow._make(r) for r in rows] == expected
+        expected_amounts = [cli._parse_euro_amount(r.importe) for r in expected]
+        assert amounts == expected_amounts
+        assert count == len(expected)
+        assert total == pytest.approx(sum(expected_amounts))
+
+
+def test_parallel_csv_coincide_con_lector_secuencial(tmp_path):
+    from contabilidad.core import parallel_csv
+
+    lines = [";Cantidades expresadas en euros"]
+    for i in range(25000):
+        lines.append(f";{i % 28 + 1}/{i % 12 + 1:02d}/2025;01/01/2025;Concepto ñ {i};-{i},{i % 100:02d};1.000,00")
+        if i % 97 == 0:
+            lines.append("")
+        if i % 331 == 0:
+            lines.append(";corta")
+    path = tmp_path / "grande.csv"
+    path.write_bytes(("\r\n".join(lines) + "\r\n").encode("utf-8"))
+    assert path.stat().st_size >= parallel_csv.MIN_PARALLEL_SIZE
+
+    expected = [tuple(r) for r in cli._bank_rows(str(path))]
+    assert parallel_csv.read_rows(str(path)) == expected
+    for processes in (2, 3, 7):
+        assert parallel_csv.read_rows(str(path), processes) == expected
+
+
+def test_bank_month_rechaza_mes_fuera_de_rango(csv_banco, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    for mes in ("0000-00", "2025-13"):
+        cli.main(["bank-month", "--csv", csv_banco, "--month", mes])
+        assert "Mes inválido" in capsys.readouterr().out
+
+
+def test_add_rechaza_importe_no_finito(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        cli.main(["add", "--concepto", "x", "--debe", "nan"])
+    assert "finito" in capsys.readouterr().err
+
+
+def test_read_bank_csv_row_no_llena_la_cache(csv_banco):
+    cli._BANK_ROWS_CACHE.clear()
+    row = cli._read_bank_csv_row(csv_banco, 2)
+    assert row.concepto == "Nómina"
+    assert not cli._BANK_ROWS_CACHE
+    # Tras bank-month el fichero queda en caché y se reutiliza
+    list(cli._bank_month_rows(csv_banco, 2025, 2))
+    assert len(cli._BANK_ROWS_CACHE) == 1
+    assert cli._read_bank_csv_row(csv_banco, 2) == row
+    with pytest.raises(IndexError):
+        cli._read_bank_csv_row(csv_banco, 99)
+
+
+def test_list_con_importe_no_finito_da_error_limpio(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "libro_diario.json").write_text(
+        '[{"fecha": "2025-01-02", "concepto": "x", "debe": NaN, "haber": 0.0}]', encoding="utf-8"
+    )
+    for argv in (["list"], ["list", "--raw"]):
+        cli.main(argv)
+        assert "Error leyendo el libro diario" in capsys.readouterr().out
+
+
+def test_main_reutiliza_el_parser(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    parser = cli._PARSER
+    monkeypatch.setattr(cli, "_build_parser", lambda: pytest.fail("el parser se reconstruye"))
+    cli.main(["add", "--fecha", "2025-01-02", "--concepto", "a", "--debe", "1"])
+    cli.main(["add", "--fecha", "2025-01-03", "--concepto", "b", "--haber", "2"])
+    assert cli._PARSER is parser
+    cli.main(["list"])
+    out = capsys.readouterr().out
+    assert "2025-01-02 | a" in out and "2025-01-03 | b" in out
+
+
+def test_default_storage_sigue_al_directorio_actual(tmp_path, monkeypatch, capsys):
+    uno, dos = tmp_path / "uno", tmp_path / "dos"
+    uno.mkdir()
+    dos.mkdir()
+    monkeypatch.chdir(uno)
+    cli.main(["add", "--fecha", "2025-01-02", "--concepto", "en-uno"])
+    storage_uno = cli._default_storage()
+    assert cli._default_storage() is storage_uno
+    monkeypatch.chdir(dos)
+    assert cli._default_storage() is not storage_uno
+    cli.main(["add", "--fecha", "2025-01-03", "--concepto", "en-dos"])
+    capsys.readouterr()
+    cli.main(["list"])
+    out = capsys.readouterr().out
+    assert "en-dos" in out and "en-uno" not in out
+    assert (uno / "data" / "libro_diario.json").read_text(encoding="utf-8").count("\n") == 1
+
+
+def test_add_sin_fecha_usa_el_dia_de_la_llamada(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    hoy = [date(2025, 1, 2)]
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return hoy[0]
+
+    monkeypatch.setattr(cli, "date", FakeDate)
+    cli.main(["add", "--concepto", "a"])
+    hoy[0] = date(2025, 1, 3)
+    cli.main(["add", "--concepto", "b"])
+    capsys.readouterr()
+    cli.main(["list"])
+    out = capsys.readouterr().out
+    assert "2025-01-02 | a" in out and "2025-01-03 | b" in out
@@ -0,0 +1,163 @@
+import json
+import sys
+from datetime import date
+
+import pytest
+
+from contabilidad.core.libro_diario import (
+    Entry,
+    EntryTable,
+    add_entry,
+    deserialize,
+    list_entries,
+    load_table,
+)
+from contabilidad.core.repositorio import JsonStorage
+
+
+def test_append_y_load_ida_y_vuelta(tmp_path):
+    storage = JsonStorage(tmp_path / "libro.json")
+    e1 = Entry(fecha=date(2025, 1, 2), concepto="Cañas", debe=1.5, haber=0.0)
+    e2 = Entry(fecha=date(2025, 1, 3), concepto="Nómina", debe=0.0, haber=2.0)
+    add_entry(storage, e1)
+    add_entry(storage, e2)
+    assert list_entries(storage) == [e1, e2]
+    # Una línea JSON por asiento
+    lines = (tmp_path / "libro.json").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["concepto"] for line in lines] == ["Cañas", "Nómina"]
+    # Una instancia nueva lee lo mismo desde disco
+    assert list_entries(JsonStorage(tmp_path / "libro.json")) == [e1, e2]
+
+
+def test_migra_fichero_antiguo_vacio(tmp_path):
+    path = tmp_path / "libro.json"
+    path.write_text("[]", encoding="utf-8")
+    storage = JsonStorage(path)
+    assert list_entries(storage) == []
+    e = Entry(fecha=date(2025, 2, 1), concepto="x", debe=3.0, haber=0.0)
+    add_entry(storage, e)
+    assert list_entries(JsonStorage(path)) == [e]
+
+
+def test_migra_fichero_antiguo_con_indentacion(tmp_path):
+    path = tmp_path / "libro.json"
+    rows = [
+        {"fecha": "2025-01-02", "concepto": "a", "debe": 1.0, "haber": 0.0},
+        {"fecha": "2025-01-03", "concepto": "b", "debe": 0.0, "haber": 2.0},
+    ]
+    path.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    storage = JsonStorage(path)
+    assert [e.concepto for e in list_entries(storage)] == ["a", "b"]
+    # Tras la primera lectura el fichero queda en JSON Lines
+    assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == rows
+
+
+def test_append_sobre_fichero_antiguo(tmp_path):
+    path = tmp_path / "libro.json"
+    path.write_text(json.dumps([{"fecha": "2025-01-02", "concepto": "a", "debe": 1.0, "haber": 0.0}]), encoding="utf-8")
+    storage = JsonStorage(path)
+    add_entry(storage, Entry(fecha=date(2025, 1, 3), concepto="b", debe=0.0, haber=2.0))
+    assert [e.concepto for e in list_entries(JsonStorage(path))] == ["a", "b"]
+
+
+def test_load_no_expone_la_cache(tmp_path):
+    storage = JsonStorage(tmp_path / "libro.json")
+    add_entry(storage, Entry(fecha=date(2025, 1, 2), concepto="a", debe=1.0, haber=0.0))
+    rows = storage.load()
+    add_entry(storage, Entry(fecha=date(2025, 1, 3), concepto="b", debe=0.0, haber=2.0))
+    assert len(rows) == 1
+    assert len(storage.load()) == 2
+
+
+def test_cache_detecta_escrituras_de_otra_instancia(tmp_path):
+    path = tmp_path / "libro.json"
+    storage = JsonStorage(path)
+    otra = JsonStorage(path)
+    add_entry(storage, Entry(fecha=date(2025, 1, 2), concepto="a", debe=1.0, haber=0.0))
+    storage.load()
+    add_entry(otra, Entry(fecha=date(2025, 1, 3), concepto="b", debe=0.0, haber=2.0))
+    add_entry(storage, Entry(fecha=date(2025, 1, 4), concepto="c", debe=0.0, haber=3.0))
+    assert [e.concepto for e in list_entries(storage)] == ["a", "b", "c"]
+
+
+def test_entry_rechaza_importes_no_finitos():
+    for valor in (float("nan"), float("inf"), float("-inf")):
+        with pytest.raises(ValueError):
+            Entry(fecha=date(2025, 1, 2), concepto="x", debe=valor, haber=0.0)
+        with pytest.raises(ValueError):
+            Entry(fecha=date(2025, 1, 2), concepto="x", debe=0.0, haber=valor)
+
+
+def test_lee_nan_escrito_por_json_estandar(tmp_path):
+    from contabilidad.core import repositorio
+
+    path = tmp_path / "libro.json"
+    path.write_text('{"fecha": "2025-01-02", "concepto": "x", "debe": NaN, "haber": 0.0}\n', encoding="utf-8")
+    rows = JsonStorage(path).load()
+    assert rows[0]["concepto"] == "x"
+    assert repositorio._loads(b'{"a": Infinity}')["a"] == float("inf")
+
+
+def test_migra_fichero_antiguo_con_nan_sin_convertirlo_en_null(tmp_path):
+    path = tmp_path / "libro.json"
+    rows = [
+        {"fecha": "2025-01-02", "concepto": "a", "debe": float("nan"), "haber": 0.0},
+        {"fecha": "2025-01-03", "concepto": "b", "debe": 0.0, "haber": 2.0},
+    ]
+    path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    storage = JsonStorage(path)
+    with pytest.raises(ValueError, match="no finitos"):
+        list_entries(storage)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert "NaN" in lines[0] and "null" not in lines[0]
+    # El fichero migrado se sigue leyendo y falla igual por ambas rutas
+    with pytest.raises(ValueError, match="no finitos"):
+        load_table(JsonStorage(path))
+
+
+def test_deserialize_convierte_importes_enteros_y_texto():
+    e = deserialize({"fecha": "2025-01-02", "concepto": "x", "debe": 3, "haber": "2.5"})
+    assert (e.debe, e.haber) == (3.0, 2.5)
+    assert type(e.debe) is float and type(e.haber) is float
+    with pytest.raises(ValueError):
+        deserialize({"fecha": "2025-01-02", "concepto": "x", "debe": None, "haber": 0})
+
+
+def _escribe_filas(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+
+def test_load_table_columnas_y_totales(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "libro.json"
+    _escribe_filas(path, [
+        {"fecha": "2025-01-02", "concepto": "a", "debe": 1.5, "haber": 0},
+        {"fecha": "2025-01-03", "concepto": "b", "debe": "2", "haber": 4.25},
+    ])
+    table = load_table(JsonStorage(path))
+    assert len(table) == 2
+    assert table.fechas == [date(2025, 1, 2), date(2025, 1, 3)]
+    assert table.conceptos == ["a", "b"]
+    assert isinstance(table.debes, np.ndarray) and table.debes.dtype == np.float64
+    assert (table.total_debe(), table.total_haber()) == (3.5, 4.25)
+
+
+def test_load_table_sin_numpy(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    path = tmp_path / "libro.json"
+    _escribe_filas(path, [
+        {"fecha": "2025-01-02", "concepto": "a", "debe": 1.5, "haber": 0},
+        {"fecha": "2025-01-03", "concepto": "b", "debe": "2", "haber": 4.25},
+    ])
+    table = load_table(JsonStorage(path))
+    assert table.debes == [1.5, 2.0] and table.haberes == [0.0, 4.25]
+    assert (table.total_debe(), table.total_haber()) == (3.5, 4.25)
+    assert len(EntryTable(fechas=[], conceptos=[], debes=[], haberes=[])) == 0
+
+
+def test_load_table_rechaza_importes_no_finitos(tmp_path):
+    path = tmp_path / "libro.json"
+    path.write_text('{"fecha": "2025-01-02", "concepto": "x", "debe": NaN, "haber": 0.0}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="no finitos"):
+        load_table(JsonStorage(path))